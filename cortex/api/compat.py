@@ -0,0 +1,6 @@
+# Python libs
+# collections.abc exists from Python 3.3, collections.Iterable was removed in Python 3.10
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
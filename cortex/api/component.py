@@ -1,28 +1,37 @@
 # Maya
-import maya.cmds as cmds
 from maya.api import OpenMaya as om
 
 
+def get_dag_path(node):
+    """
+    Returns the MDagPath of node. If node is already an MDagPath it is returned as is, which lets callers that already
+    hold a dag path skip the name lookup.
+
+    :param node: (str|MDagPath) name or dag path of a dag node
+
+    :return: (MDagPath) the dag path of node
+    """
+
+    if isinstance(node, om.MDagPath):
+        return node
+
+    return om.MGlobal.getSelectionListByName(node).getDagPath(0)
+
+
 def get_cv_positions_from_curve(curve, space='world'):
     """
     Returns the positions of all the cvs of curve. Either in world space or in object space
-    
-    :param curve: (str) name of a nurbsCurve
+
+    :param curve: (str|MDagPath) name or dag path of a nurbsCurve
     :param space: (str) either world or object
-    
-    :return: cvs positions 
+
+    :return: cvs positions
     """
 
-    curve_object = om.MGlobal.getSelectionListByName(curve).getDagPath(0)
-    curve_fn = om.MFnNurbsCurve(curve_object)
-    num_cvs = curve_fn.numCVs
-    data = dict()
+    curve_fn = om.MFnNurbsCurve(get_dag_path(curve))
 
-    for cv_index in range(num_cvs):
-        if not space == 'world':
-            position = curve_fn.cvPosition(cv_index)
-        else:
-            position = curve_fn.cvPosition(cv_index, space=om.MSpace.kWorld)
-        data[cv_index] = position[0], position[1], position[2]
+    # Query all the cvs in a single call rather than one cvPosition() call per cv
+    m_space = om.MSpace.kWorld if space == 'world' else om.MSpace.kObject
+    positions = curve_fn.cvPositions(m_space)
 
-    return data
+    return {cv_index: (point.x, point.y, point.z) for cv_index, point in enumerate(positions)}
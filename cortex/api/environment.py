@@ -6,6 +6,51 @@ CORTEX = 'D:/CG/DEV/cortex'
 CONTROLSHAPES_LIBRARY = 'D:/CG/DEV/cortex/library/controlshapes'
 CONTROLSHAPES_COLOR = 'D:/CG/DEV/cortex/library/colors/controlshapes.json'
 
+# Directories already found on disk
+_EXISTING_DIRS = set()
+
+
+def _isdir(path):
+    """
+    Cached os.path.isdir. Only existing directories are cached, so a directory created later is still found. A
+    directory deleted during the session is still reported as existing until clear_dir_cache() is called.
+
+    :param path: (str) path of a directory
+
+    :return: (bool) True if the directory exists
+    """
+
+    if path in _EXISTING_DIRS:
+        return True
+
+    if os.path.isdir(path):
+        _EXISTING_DIRS.add(path)
+        return True
+
+    return False
+
+
+def clear_dir_cache():
+    """
+    Clears the directories found on disk, e.g. after directories were deleted during the session. They are checked on
+    disk again on their next query.
+    """
+
+    _EXISTING_DIRS.clear()
+
+
+def _join(*parts):
+    """
+    Joins path parts and normalizes the result with forward slashes. '.' and '..' parts are collapsed and empty parts
+    ignored, so the same directory always gives the same path, e.g. as an _isdir() cache key.
+
+    :param parts: (str) path parts
+
+    :return: (str) the joined path
+    """
+
+    return os.path.normpath(os.path.join(*parts)).replace('\\', '/')
+
 
 class Environment(object):
     """
@@ -39,15 +84,14 @@ class Environment(object):
         """
 
         # Current Asset environment
-        environment = os.path.join(PROD, show, division, asset_type, asset_name).replace(os.sep, '/')
-        if not os.path.isdir(environment):
+        environment = _join(PROD, show, division, asset_type, asset_name)
+        if not _isdir(environment):
             print('failed to set environment')
 
         Environment.current = environment
 
         # Data path
-        data_path = os.path.join(environment, 'rig/DATA')
-        Environment.data_path = os.path.normpath(data_path)
+        Environment.data_path = _join(environment, 'rig/DATA')
 
     def set_shot(self):
         pass
@@ -0,0 +1,79 @@
+# Python libs
+import json
+
+# orjson is an optional, faster json backend. The json standard library is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data, indent=False):
+    """
+    Encodes data to a json document.
+
+    :param data: (dict|list) the data to encode
+    :param indent: (bool) indent the json document with 2 spaces, otherwise write it compact
+
+    :return: (bytes) the json document
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def loads(document):
+    """
+    Decodes a json document.
+
+    :param document: (bytes|str) the json document
+
+    :return: (dict|list) the decoded data
+    """
+
+    if orjson is not None:
+        return orjson.loads(document)
+
+    return json.loads(document)
+
+
+def dump(data, path, indent=False):
+    """
+    Writes data to a json file.
+    With the json standard library the data is encoded straight into the file rather than into an intermediate string.
+
+    :param data: (dict|list) the data to write
+    :param path: (str) path of the json file
+    :param indent: (bool) indent the json document with 2 spaces, otherwise write it compact
+    """
+
+    if orjson is not None:
+        with open(path, 'wb') as handle:
+            handle.write(dumps(data, indent=indent))
+        return
+
+    with open(path, 'w') as handle:
+        if indent:
+            json.dump(data, handle, indent=2)
+        else:
+            json.dump(data, handle, separators=(',', ':'))
+
+
+def load(path):
+    """
+    Reads a json file in a single read.
+
+    :param path: (str) path of the json file
+
+    :return: (dict|list) the file data
+    """
+
+    with open(path, 'rb') as handle:
+        return loads(handle.read())
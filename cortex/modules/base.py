@@ -1,12 +1,23 @@
 # Python lib
-import json
+import copy
+import errno
+import logging
 import os
 
 # Maya
 import maya.cmds as cmds
+from maya.api import OpenMaya as om
 
 # Cortex
 from ..api import environment
+from ..api import json_utils
+
+# Logger
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+# Naming
+GUIDE_SUFFIX = '_GUIDE'
 
 
 class Base(object):
@@ -49,6 +60,12 @@ class Base(object):
     
     """
 
+    # Deserialized module step files, {file path: (modification time, data)}
+    _data_cache = dict()
+
+    # Files found in the module data directories, {module data directory: (modification time, set of file names)}
+    _data_index = dict()
+
     def __init__(self, name):
 
         # input attributes
@@ -59,6 +76,62 @@ class Base(object):
         self.build_data = dict()
         self.connect_data = dict()
 
+        # module data directory, built from the environment data path it was cached for
+        self._data_path = None
+        self._module_data_path = None
+        self._existing_dirs = set()
+
+    def get_module_data_path(self):
+        """
+        Returns the data directory of the module in the current environment.
+        The path is cached and only rebuilt when the environment data path changes.
+
+        :return: (str) the module data directory
+        """
+
+        data_path = environment.Environment.data_path
+        if not self._module_data_path or not self._data_path == data_path:
+            self._data_path = data_path
+            self._module_data_path = os.path.join(data_path, self.name)
+
+        return self._module_data_path
+
+    @classmethod
+    def get_data_index(cls, module_data_path):
+        """
+        Returns the names of the files in a module data directory. The directory is listed once, then answered from
+        memory until its modification time changes, e.g. when files are added to it by this or another session.
+
+        :param module_data_path: (str) a module data directory
+
+        :return: (set of str) file names, empty if the directory does not exist
+        """
+
+        try:
+            mtime = os.path.getmtime(module_data_path)
+        except OSError:
+            # Missing directories are not cached, they are found as soon as they are created
+            cls._data_index.pop(module_data_path, None)
+            return set()
+
+        cached = cls._data_index.get(module_data_path)
+        if not cached or not cached[0] == mtime:
+            try:
+                cached = (mtime, set(os.listdir(module_data_path)))
+            except OSError:
+                return set()
+            cls._data_index[module_data_path] = cached
+
+        return cached[1]
+
+    @classmethod
+    def clear_data_index(cls):
+        """
+        Clears the module data directories index, so that every directory is listed again on its next query.
+        """
+
+        cls._data_index.clear()
+
     def start(self):
 
         data = self.deserialize(self.name, step='start')
@@ -67,42 +140,132 @@ class Base(object):
 
     def build(self):
 
-        self.build_data = self.deserialize(self.name, step='build') if not None else dict()
+        self.build_data = self.deserialize(self.name, step='build') or dict()
 
     def connect(self):
 
-        self.connect_data = self.deserialize(self.name, step='connect') if not None else dict()
+        self.connect_data = self.deserialize(self.name, step='connect') or dict()
+
+    @staticmethod
+    def create_guides(names, matrices=None):
+        """
+        Creates guides locators. All the guides are created, named and placed in a single undo chunk, so that one undo
+        removes them all.
+
+        :param names: (iterable of str) names of the guides
+        :param matrices: (dict) world matrices (16 floats) of the guides to place, by guide name
 
-    def serialize(self, module_attribute=None, module_step=None, data=None):
+        :return: (list of str) the guides names, which maya suffixes if a name is already taken
+        """
+
+        matrices = matrices or dict()
+
+        guides = list()
+        cmds.undoInfo(openChunk=True)
+        try:
+            for name in names:
+                guide = cmds.createNode('transform', n=name, skipSelect=True)
+                cmds.createNode('locator', n='{0}Shape'.format(guide), parent=guide, skipSelect=True)
+                if name in matrices:
+                    cmds.xform(guide, worldSpace=True, matrix=matrices[name])
+                guides.append(guide)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        return guides
+
+    @classmethod
+    def create_guide_hierarchy(cls, names, matrices=None, parents=None):
+        """
+        Creates, places and parents guides locators, in a single undo chunk.
+
+        Guides are parented once they all exist, a guide can be parented to a guide created after it. Guides sharing a
+        parent are parented in a single call. Maya renames guides whose names are already taken, so guides, and parents
+        that are guides being created, are parented by the names they were created with.
+
+        :param names: (iterable of str) names of the guides
+        :param matrices: (dict) world matrices (16 floats) of the guides to place, by guide name
+        :param parents: (dict) guide names to parent, by parent name
+
+        :return: (list of str) the guides names, which maya suffixes if a name is already taken
+        """
+
+        names = list(names)
+        parents = parents or dict()
+
+        cmds.undoInfo(openChunk=True)
+        try:
+            guides = cls.create_guides(names, matrices)
+
+            created_names = dict(zip(names, guides))
+            for parent, guide_names in parents.items():
+                cmds.parent([created_names[guide] for guide in guide_names], created_names.get(parent, parent))
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        return guides
+
+    def _make_dirs(self, path):
+        """
+        Creates a directory and its parents, if they do not exist yet, and remembers it as existing.
+
+        :param path: (str) path of a directory
+        """
+
+        try:
+            os.makedirs(path)
+        except OSError as error:
+            if not error.errno == errno.EEXIST:
+                raise
+        self._existing_dirs.add(path)
+
+    def serialize(self, module_attribute=None, module_step=None, data=None, pretty=True):
         """
         Saves/Writes a module's module_step data on disk.
-        
-        :param module_attribute: (str) name of a module attribute to serialize
+
+        All the data of a module_step is written to a single file, {module data directory}/{module_step}.json, which
+        is the file read back by deserialize(). Module attributes of a step should be stored as keys of data rather
+        than serialized separately.
+
+        :param module_attribute: (str) no longer supported, module attributes are not serialized separately. Pass
+                                 module_step and data as keyword arguments
         :param module_step: (str) either start, build or connect 
         :param data: (dict) the data to write on disk
+        :param pretty: (bool) indent the json file. Turn off to write smaller files faster
 
-        :return: (str, str, dict) module_attribute, module_step, data
+        :return: (str, dict) the path of the written file, data
         """
 
-        if not module_attribute or not module_step or not data:
+        if module_attribute is not None:
+            log.error('serialize no longer takes a module attribute ({0}), data of module {1} not written. Store it '
+                      'as a key of the module_step data instead.'.format(module_attribute, self.name))
             return None
 
-        data = json.dumps(data, indent=2)
+        if not module_step or not data:
+            return None
 
-        module_data_path = os.path.join(environment.Environment.data_path, self.name)
-        if not os.path.isdir(module_data_path):
-            os.mkdir(module_data_path)
+        module_data_path = self.get_module_data_path()
 
-        module_step = os.path.join(module_data_path, module_step)
-        if not os.path.isdir(module_data_path):
-            os.mkdir(module_data_path)
+        # Create the module directory without checking for it first. A directory created or found once is not
+        # created again
+        if module_data_path not in self._existing_dirs:
+            self._make_dirs(module_data_path)
 
-        module_attribute_file = os.path.join(module_step, '{0}.json'.format(module_attribute))
+        step_file = '{0}.json'.format(module_step)
+        step_path = os.path.join(module_data_path, step_file)
 
-        with open(module_attribute_file, 'w+') as handle:
-            handle.write(data)
+        try:
+            json_utils.dump(data, step_path, indent=pretty)
+        except (IOError, OSError):
+            # The directory may have been deleted since it was created or found, create it again and retry once
+            self._existing_dirs.discard(module_data_path)
+            environment.clear_dir_cache()
+            self._make_dirs(module_data_path)
+            json_utils.dump(data, step_path, indent=pretty)
+        Base._data_cache.pop(step_path, None)
+        Base._data_index.pop(module_data_path, None)
 
-        return module_step, module_attribute, data
+        return step_path, data
 
     def serialize_start_data(self, guides):
         """
@@ -121,17 +284,24 @@ class Base(object):
                         ...
                         }
         """
+        # Resolve all the guides at once and read their data through the API rather than with cmds queries per guide
+        guides = list(guides)
+        selection = om.MSelectionList()
         for guide in guides:
+            selection.add(guide)
+
+        for i, guide in enumerate(guides):
             self.start_data[guide] = dict(matrix=list(), hierarchy='')
 
-            mat = cmds.xform(guide, q=True, worldSpace=True, matrix=True)
-            self.start_data[guide]['matrix'] = mat
+            guide_dag = selection.getDagPath(i)
+            self.start_data[guide]['matrix'] = list(guide_dag.inclusiveMatrix())
 
-            parent = cmds.listRelatives(guide, parent=True)
-            if parent:
-                self.start_data[str(guide)]['hierarchy'] = parent[0]
+            # Popping the guide from its dag path leaves its parent path, which is empty for a guide below the world
+            guide_dag.pop()
+            if guide_dag.length():
+                self.start_data[guide]['hierarchy'] = guide_dag.partialPathName()
             else:
-                self.start_data[str(guide)]['hierarchy'] = 'world'
+                self.start_data[guide]['hierarchy'] = 'world'
 
         self.serialize(module_step='start', data=self.start_data)
 
@@ -152,25 +322,32 @@ class Base(object):
         
         :return: 
         """
-        print(module_name, step)
+        log.debug('deserialize module : %s, step : %s', module_name, step)
         if not step:
             return None
 
-        print 'been here'
-        data_path = environment.Environment.data_path
-        print (data_path, type(data_path))
-        module_path = os.path.join(data_path, module_name)
-        if not os.path.isdir(module_path):
+        if module_name == self.name:
+            module_data_path = self.get_module_data_path()
+        else:
+            module_data_path = os.path.join(environment.Environment.data_path, module_name)
+        # Modules without data, e.g. on a first build, are answered from the index without touching the disk
+        step_file = '{0}.json'.format(step)
+        if step_file not in self.get_data_index(module_data_path):
             return None
 
-        print 'been there'
-        step_path = os.path.join(module_path, '{0}.json'.format(step))
-        if not os.path.isfile(step_path):
+        step_path = os.path.join(module_data_path, step_file)
+        try:
+            mtime = os.path.getmtime(step_path)
+        except OSError:
             return None
 
-        print 'all the way'
-        with open(step_path, 'r') as handle:
-            return json.load(handle)
+        # Parse the file only if it changed since it was last deserialized
+        cached = Base._data_cache.get(step_path)
+        if not cached or not cached[0] == mtime:
+            cached = (mtime, json_utils.load(step_path))
+            Base._data_cache[step_path] = cached
+
+        return copy.deepcopy(cached[1])
 
 
 
@@ -2,11 +2,12 @@
 import collections
 
 # Maya
-import maya.cmds as cmds
+from maya.api import OpenMaya as om
 
 # Cortex
-from .base import Base
-from ..rigobject.control import Control
+from .base import Base, GUIDE_SUFFIX
+from ..api.compat import Iterable
+from ..rigobject.control import Control, CTL_SUFFIX
 
 
 class Fk(Base):
@@ -17,7 +18,7 @@ class Fk(Base):
         # input attributes
         if isinstance(objects, str):
             self.objects = (objects,)
-        elif isinstance(objects, collections.Iterable):
+        elif isinstance(objects, Iterable):
             self.objects = tuple(objects)
         else:
             self.objects = ('fk_0', )
@@ -33,20 +34,22 @@ class Fk(Base):
 
         super(Fk, self).start()
 
+        guide_names = list()
+        guide_matrices = dict()
+        guide_parents = collections.defaultdict(list)
         for object_name in self.objects:
-            guide_object = cmds.spaceLocator(name='{0}_GUIDE'.format(object_name))[0]
-            self.guides.append(guide_object)
+            guide_name = object_name + GUIDE_SUFFIX
+            guide_names.append(guide_name)
 
-            # Retrieve guide's position from stored data
-            if guide_object in self.start_data.keys():
-                cmds.xform(guide_object, worldSpace=True, matrix=self.start_data[guide_object]['matrix'])
+            # Retrieve guide's position and parent from stored data
+            guide_data = self.start_data.get(guide_name)
+            if not guide_data:
+                continue
+            guide_matrices[guide_name] = guide_data['matrix']
+            if not guide_data['hierarchy'] == 'world':
+                guide_parents[guide_data['hierarchy']].append(guide_name)
 
-        # Retrieve guide's parent from stored data
-        for guide_object in self.guides:
-            if guide_object in self.start_data.keys():
-                parent = self.start_data[guide_object]['hierarchy']
-                if not parent == 'world':
-                    cmds.parent(guide_object, parent)
+        self.guides.extend(self.create_guide_hierarchy(guide_names, guide_matrices, guide_parents))
 
     def build(self):
         """
@@ -59,11 +62,22 @@ class Fk(Base):
             print('no start objects found,  abort.')
             return
 
+        # Place each control on the guide start() created for its object. Guides are read by the names they were
+        # created with, which maya suffixes if a name was already taken
+        selection = om.MSelectionList()
         for guide in self.guides:
-            ctl = Control.create(guide.replace('_GUIDE', '_CTL'))
+            selection.add(guide)
+
+        names = list()
+        matrices = dict()
+        for i, object_name in enumerate(self.objects[:len(self.guides)]):
+            name = object_name + CTL_SUFFIX
+            names.append(name)
+            matrices[name] = list(selection.getDagPath(i).inclusiveMatrix())
+
+        # Create all the buffers, controls and joints at once
+        for ctl in Control.build_rig(names, matrices):
             ctl.set_shape_from_library('square')
-            ctl.add_buffer()
-            ctl.add_joint()
 
     def connect(self):
         super(Fk, self).connect()
@@ -1,11 +1,9 @@
 # Python libs
 import collections
 
-# Maya
-import maya.cmds as cmds
-
 # Cortex
-from .base import Base
+from .base import Base, GUIDE_SUFFIX
+from ..api.compat import Iterable
 from ..rigobject.control import Control
 
 
@@ -17,7 +15,7 @@ class Ik(Base):
         # input attributes
         if isinstance(objects, str):
             self.objects = (objects,)
-        elif isinstance(objects, collections.Iterable):
+        elif isinstance(objects, Iterable):
             self.objects = tuple(objects)
         else:
             self.objects = ('fk_0', )
@@ -33,18 +31,21 @@ class Ik(Base):
 
         super(Ik, self).start()
 
+        guide_names = list()
+        guide_matrices = dict()
+        guide_parents = collections.defaultdict(list)
         for object_name in self.objects:
-            guide_object = cmds.spaceLocator(name='{0}_GUIDE'.format(object_name))[0]
-            self.guides.append(guide_object)
+            guide_name = object_name + GUIDE_SUFFIX
+            guide_names.append(guide_name)
 
-            # Retrieve guide's position from stored data
-            if object_name in self.start_data.keys():
-                cmds.xform(guide_object, worldSpace=True, matrix=self.start_data[object_name]['matrix'])
+            # Retrieve guide's position and parent from stored data
+            guide_data = self.start_data.get(object_name)
+            if not guide_data:
+                continue
+            guide_matrices[guide_name] = guide_data['matrix']
+            guide_parents[guide_data['parent']].append(guide_name)
 
-        # Retrieve guide's parent from stored data
-        for object_name in self.objects:
-            if object_name in self.start_data.keys():
-                cmds.parent('{0}_GUIDE'.format(object_name), self.start_data[object_name]['parent'])
+        self.guides.extend(self.create_guide_hierarchy(guide_names, guide_matrices, guide_parents))
 
     def build(self):
         super(Ik, self).build()
@@ -1,21 +1,134 @@
 # Python libs
-import collections
+import copy
 import os
-import json
 import logging
+import re
 
 # Maya
 import maya.cmds as cmds
 from maya.api import OpenMaya as om
 
 # Cortex
-from ..api import component
 from ..api import environment
+from ..api import json_utils
+from ..api.compat import Iterable
 
 # Logger
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
+# Naming
+CTL_SUFFIX = '_CTL'
+BUF_SUFFIX = '_BUF'
+JNT_SUFFIX = '_JNT'
+_CTL_SUFFIX_PATTERN = re.compile('{0}$'.format(CTL_SUFFIX))
+
+# Function sets shared by all the controls, re-targeted with setObject() rather than created on each query
+_FN_DAG = om.MFnDagNode()
+_FN_CURVE = om.MFnNurbsCurve()
+
+# Parsed controlShape library files, {file path: (modification time, data)}
+_LIBRARY_CACHE = dict()
+
+
+def _load_library_file(library_file):
+    """
+    Returns the data of a controlShape library json file.
+    Files are parsed once and cached by path, a file is parsed again only when its modification time changes.
+
+    :param library_file: (str) path of a controlShape library file
+
+    :return: (dict) a copy of the file data, safe to modify
+    """
+
+    mtime = os.path.getmtime(library_file)
+    cached = _LIBRARY_CACHE.get(library_file)
+    if not cached or not cached[0] == mtime:
+        cached = (mtime, json_utils.load(library_file))
+        _LIBRARY_CACHE[library_file] = cached
+
+    return copy.deepcopy(cached[1])
+
+
+def _get_ordered_points(point):
+    """
+    Returns the cv positions of a shape point data ordered by cv index.
+
+    Point data is a list of cv positions already ordered by cv index, as stored by Control.get_shape_data(). Older
+    data is also accepted : a dictionary {cv index: position}, with int or str keys, or a list of
+    [[cv index, cv name, indices], position] pairs as stored in older controlShape library files.
+    Indices are compared as integers so that cv 10 is placed after cv 9 and not after cv 1.
+
+    :param point: (list|dict) the point data of a shape
+
+    :return: (list) cv positions
+    """
+
+    if isinstance(point, dict):
+        return [point[key] for key in sorted(point, key=int)]
+
+    if point and isinstance(point[0][0], (list, tuple)):
+        return [position for cv, position in sorted(point, key=lambda pair: pair[0][0])]
+
+    return point
+
+
+def _get_override_color(shape_dag):
+    """
+    Reads the drawing override color of a shape through its plugs rather than with getAttr commands.
+
+    :param shape_dag: (MDagPath) dag path of a shape
+
+    :return: (int|tuple|None) the override color index, the rgb override color rounded to 3 decimals, or None if the
+             shape has no drawing override
+    """
+
+    _FN_DAG.setObject(shape_dag)
+    if not _FN_DAG.findPlug('overrideEnabled', False).asBool():
+        return None
+    if not _FN_DAG.findPlug('overrideRGBColors', False).asBool():
+        return _FN_DAG.findPlug('overrideColor', False).asInt()
+
+    rgb_plug = _FN_DAG.findPlug('overrideColorRGB', False)
+    return tuple(round(rgb_plug.child(i).asFloat(), 3) for i in range(3))
+
+
+def _set_override_color(shape_dag, color):
+    """
+    Writes the drawing override color of a shape. The current color is read through the shape plugs and nothing is
+    written if the shape already has that override color, so that unchanged shapes are not dirtied. Colors are written
+    with setAttr commands so that they can be undone.
+
+    :param shape_dag: (MDagPath) dag path of a shape
+    :param color: (int|list) an override color index or an rgb color
+    """
+
+    _FN_DAG.setObject(shape_dag)
+    enabled_plug = _FN_DAG.findPlug('overrideEnabled', False)
+    rgb_mode_plug = _FN_DAG.findPlug('overrideRGBColors', False)
+
+    # Color names are strings, which are iterable too
+    if isinstance(color, Iterable) and not isinstance(color, str):
+        rgb_plugs = [_FN_DAG.findPlug('overrideColorRGB', False).child(i) for i in range(3)]
+        # Compare with a tolerance, the rgb plugs hold single precision floats
+        matching = all(abs(plug.asFloat() - value) < 1e-5 for plug, value in zip(rgb_plugs, color))
+        if matching and enabled_plug.asBool() and rgb_mode_plug.asBool():
+            return
+
+        shape = shape_dag.partialPathName()
+        cmds.setAttr('{0}.overrideEnabled'.format(shape), True)
+        cmds.setAttr('{0}.overrideRGBColors'.format(shape), True)
+        cmds.setAttr('{0}.overrideColorRGB'.format(shape), color[0], color[1], color[2])
+    else:
+        index_plug = _FN_DAG.findPlug('overrideColor', False)
+        if enabled_plug.asBool() and not rgb_mode_plug.asBool() and index_plug.asInt() == color:
+            return
+
+        shape = shape_dag.partialPathName()
+        cmds.setAttr('{0}.overrideEnabled'.format(shape), True)
+        cmds.setAttr('{0}.overrideRGBColors'.format(shape), False)
+        cmds.setAttr('{0}.overrideColor'.format(shape), color)
+
 
 class Control(object):
     """
@@ -41,6 +154,11 @@ class Control(object):
     head_ctl.color = spine_ctlColor
     """
 
+    # Parsed controlShapes color library, {color name: color value}, and its inverse {color value: color name}.
+    # Loaded on first use and shared by all the controls
+    _color_lib = None
+    _color_lib_inverse = None
+
     def __init__(self, name):
 
         # input attributes
@@ -54,23 +172,127 @@ class Control(object):
         self.joint = None
         self._shape = dict()
         self._color = dict()
+        self._shape_dags = None
+
+        # The control node and dag path are resolved once, queries reuse them rather than looking the control up by
+        # name each time
+        selection = om.MSelectionList()
+        selection.add(name)
+        self._node = om.MObjectHandle(selection.getDependNode(0))
+        self._dag_path = selection.getDagPath(0)
 
     @classmethod
-    def create(cls, name):
+    def create(cls, name, with_default_shape=True):
         """
         Creates a control (a transform). Instantiate the class with that control name as argument.
 
         :param name: (str) name of the control
+        :param with_default_shape: (bool) give the control the default shape. Turn off when the control shape is set
+                                   right after, e.g. from the controlShape library
 
         :return: Control() class instance set to control
         """
 
         ctl = cmds.createNode('transform', n=name, skipSelect=True)
         node = cls(ctl)
-        node.shape = None
+        if with_default_shape:
+            node.shape = None
 
         return node
 
+    @classmethod
+    def create_many(cls, names, with_default_shape=False):
+        """
+        Creates controls (transforms). All the controls, and their default shapes, are created in a single undo chunk
+        with the viewport refresh suspended, rather than with one create() call and one refresh per control.
+
+        :param names: (iterable of str) names of the controls
+        :param with_default_shape: (bool) give the controls the default shape
+
+        :return: (list of Control) Control() class instances set to the controls
+        """
+
+        controls = list()
+        cmds.undoInfo(openChunk=True)
+        cmds.refresh(suspend=True)
+        try:
+            for name in names:
+                ctl = cls(cmds.createNode('transform', n=name, skipSelect=True))
+                if with_default_shape:
+                    ctl.shape = None
+                controls.append(ctl)
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.undoInfo(closeChunk=True)
+
+        return controls
+
+    @classmethod
+    def build_rig(cls, names, matrices=None):
+        """
+        Creates controls with their buffer and joint. Each node is created directly below its parent rather than
+        with create(), add_buffer() and add_joint() calls per control, which place and parent the nodes afterwards.
+        All the nodes are created in a single undo chunk. The controls are created without shapes.
+
+        Each control is created below its buffer and its joint directly below the control, both with an identity
+        transformation. The buffer holds the control world matrix.
+
+        :param names: (iterable of str) names of the controls
+        :param matrices: (dict) world matrices (16 floats) of the controls to place, by control name
+
+        :return: (list of Control) Control() class instances set to the controls
+        """
+
+        matrices = matrices or dict()
+
+        controls = list()
+        cmds.undoInfo(openChunk=True)
+        try:
+            for name in names:
+                buffer_name = cmds.createNode('transform', n=_CTL_SUFFIX_PATTERN.sub(BUF_SUFFIX, name), skipSelect=True)
+                if name in matrices:
+                    cmds.xform(buffer_name, worldSpace=True, matrix=matrices[name])
+                ctl_name = cmds.createNode('transform', n=name, parent=buffer_name, skipSelect=True)
+                joint_name = cmds.createNode('joint',
+                                             n=_CTL_SUFFIX_PATTERN.sub(JNT_SUFFIX, name),
+                                             parent=ctl_name,
+                                             skipSelect=True)
+
+                ctl = cls(ctl_name)
+                ctl.buffer = buffer_name
+                ctl.joint = joint_name
+                controls.append(ctl)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        return controls
+
+    @classmethod
+    def _get_color_lib(cls):
+        """
+        Returns the controlShapes color library. The library file is parsed once, on first use.
+
+        :return: (dict) color name:color value
+        """
+
+        if cls._color_lib is None:
+            color_lib = json_utils.load(environment.CONTROLSHAPES_COLOR)
+            # rgb colors are indexed rounded to 3 decimals, as they are read from the shapes
+            cls._color_lib_inverse = {tuple(round(c, 3) for c in val) if isinstance(val, list) else val: key
+                                      for key, val in color_lib.items()}
+            cls._color_lib = color_lib
+
+        return cls._color_lib
+
+    @classmethod
+    def clear_color_lib(cls):
+        """
+        Clears the cached controlShapes color library, e.g. after the library file was edited.
+        """
+
+        cls._color_lib = None
+        cls._color_lib_inverse = None
+
     @property
     def shape(self):
         """
@@ -97,7 +319,8 @@ class Control(object):
                 return
             self._shape = value
         else:
-            self._shape = DEFAULT_SHAPE
+            # Copy the default shape so that modifying a control shape data never alters the module default
+            self._shape = copy.deepcopy(DEFAULT_SHAPE)
         self.set_shape_data()
 
     @property
@@ -112,25 +335,19 @@ class Control(object):
         :return: (dict) shape name:color name
         """
         if not self._color:
-            shapes = self.get_shape()
             colors = dict()
-            color_lib = environment.CONTROLSHAPES_COLOR
-            with open(color_lib, 'r') as handle:
-                color_lib = json.load(handle)
+            self._get_color_lib()
 
-            for shape in shapes:
-                if not cmds.getAttr('{0}.overrideEnabled'.format(shape)):
+            for shape_dag in self._get_shape_dag_paths():
+                shape = shape_dag.partialPathName()
+                color = _get_override_color(shape_dag)
+                if color is None:
                     colors[shape] = 'no override'
                     continue
-                if not cmds.getAttr('{0}.overrideRGBColors'.format(shape)):
-                    color = cmds.getAttr('{0}.overrideColor'.format(shape))
-                else:
-                    color = cmds.getAttr('{0}.overrideColorRGB'.format(shape))[0]
-                    color = [float('%.3f'%c) for c in color]
 
-                for key, val in color_lib.items():
-                    if color == val:
-                        colors[shape] = key
+                color_name = self._color_lib_inverse.get(color)
+                if color_name:
+                    colors[shape] = color_name
             self._color = colors
 
         return self._color
@@ -148,12 +365,10 @@ class Control(object):
 
         """
 
-        if not isinstance(value, str) or isinstance(value, dict):
+        if not isinstance(value, (str, dict)):
             log.error('You mush specify a color name from the controlshapes color library. Abort.')
             return
-        color_lib = environment.CONTROLSHAPES_COLOR
-        with open(color_lib, 'r') as handle:
-            color_lib = json.load(handle)
+        color_lib = self._get_color_lib()
 
         if isinstance(value, str):
             if value not in color_lib.keys():
@@ -162,35 +377,37 @@ class Control(object):
                 return
 
             color = color_lib[value]
-            for shape in self.get_shape():
-                cmds.setAttr('{0}.overrideEnabled'.format(shape), True)
-                if isinstance(color, collections.Iterable):
-                    cmds.setAttr('{0}.overrideRGBColors'.format(shape), True)
-                    cmds.setAttr('{0}.overrideColorRGB'.format(shape), color[0], color[1], color[2])
-                else:
-                    cmds.setAttr('{0}.overrideRGBColors'.format(shape), False)
-                    cmds.setAttr('{0}.overrideColor'.format(shape), color)
-                self._color[shape] = value
+            # The colors of all the shapes are a single undo step
+            cmds.undoInfo(openChunk=True)
+            try:
+                for shape_dag in self._get_shape_dag_paths():
+                    _set_override_color(shape_dag, color)
+                    self._color[shape_dag.partialPathName()] = value
+            finally:
+                cmds.undoInfo(closeChunk=True)
         else:
-            for shape, color_name in value:
-                if color_name not in color_lib.keys():
+            # Shapes are looked up in the control shapes resolved once, rather than queried from the scene per shape
+            shape_dags = {shape_dag.partialPathName(): shape_dag for shape_dag in self._get_shape_dag_paths()}
+
+            # Validate all the colors before setting any, so that an unknown color leaves every shape unchanged
+            for shape, color_name in value.items():
+                if color_name not in color_lib:
                     log.error('The color you specified : {0} for shape {1} does not exist in the controlshapes'
                               ' color library. Abort.'.format(color_name, shape))
                     return
 
-                color = color_lib[color_name]
-                if cmds.objExists(shape) and cmds.listRelatives(shape, parent=True) == self.name:
-                    cmds.setAttr('{0}.overrideEnabled'.format(shape), True)
-                    if isinstance(color, collections.Iterable):
-                        cmds.setAttr('{0}.overrideRGBColors'.format(shape), True)
-                        cmds.setAttr('{0}.overrideColorRGB'.format(shape), color[0], color[1], color[2])
+            cmds.undoInfo(openChunk=True)
+            try:
+                for shape, color_name in value.items():
+                    if shape in shape_dags:
+                        _set_override_color(shape_dags[shape], color_lib[color_name])
+                        self._color[shape] = color_name
                     else:
-                        cmds.setAttr('{0}.overrideRGBColors'.format(shape), True)
-                        cmds.setAttr('{0}.overrideColor'.format(shape), color)
-                    self._color[shape] = color_name
-                else:
-                    log.warning('shape : {0} does not exists or is not a child of control : {1}'.format(shape, self.name))
-                    continue
+                        log.warning('shape : {0} does not exists or is not a child of control : {1}'.format(shape,
+                                                                                                          self.name))
+                        continue
+            finally:
+                cmds.undoInfo(closeChunk=True)
 
     def add_buffer(self):
         """
@@ -200,14 +417,29 @@ class Control(object):
         """
 
         if not self.buffer:
-            self.buffer = cmds.createNode('transform', n=self.name.replace('_CTL', '_BUF'), skipSelect=True)
-            cmds.xform(self.buffer, worldSpace=True, matrix=cmds.xform(self.name, q=True, worldSpace=True, matrix=True))
+            buffer_name = _CTL_SUFFIX_PATTERN.sub(BUF_SUFFIX, self.name)
+
+            # Create the buffer below the control parent, popping the control from its dag path leaves its parent path
+            ctl_dag = self._get_dag_path()
+            parent_dag = om.MDagPath(ctl_dag)
+            parent_dag.pop()
+
+            # Creating, placing and parenting the buffer is a single undo step
+            cmds.undoInfo(openChunk=True)
+            try:
+                if parent_dag.length():
+                    self.buffer = cmds.createNode('transform', n=buffer_name, parent=parent_dag.partialPathName(),
+                                                  skipSelect=True)
+                else:
+                    self.buffer = cmds.createNode('transform', n=buffer_name, skipSelect=True)
 
-            ctl_parent = cmds.listRelatives(self.name, parent=True)
-            if ctl_parent:
-                cmds.parent(self.buffer, ctl_parent[0])
+                # Match the control world matrix, read from the control dag path rather than queried with xform
+                cmds.xform(self.buffer, worldSpace=True, matrix=list(ctl_dag.inclusiveMatrix()))
 
-            cmds.parent(self.name, self.buffer)
+                cmds.parent(self.name, self.buffer)
+            finally:
+                cmds.undoInfo(closeChunk=True)
+            self._shape_dags = None
         else:
             log.warning('control : {0} has already a buffer associated with it : {1}'.format(self.name, self.buffer))
 
@@ -220,12 +452,12 @@ class Control(object):
         :return: (str) joint's name
         """
         if not self.joint:
-            self.joint = cmds.createNode('joint', n=self.name.replace('_CTL', '_JNT'), skipSelect=True)
-            cmds.xform(self.joint, worldSpace=True, matrix=cmds.xform(self.name, q=True, worldSpace=True, matrix=True))
-            cmds.parent(self.joint, self.name)
-
-            for attr in ('tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'jointOrientX', 'jointOrientY', 'jointOrientZ'):
-                cmds.setAttr('{0}.{1}'.format(self.joint, attr), 0.0)
+            # A joint created below the control has a zero local transformation, it matches the control matrix
+            # without having to be placed, parented and zeroed
+            self.joint = cmds.createNode('joint',
+                                         n=_CTL_SUFFIX_PATTERN.sub(JNT_SUFFIX, self.name),
+                                         parent=self._get_dag_path().partialPathName(),
+                                         skipSelect=True)
         else:
             log.warning('control : {0} has already a joint associated with it : {1}'.format(self.name, self.joint))
 
@@ -238,76 +470,116 @@ class Control(object):
         Returns: (list of str) curves shape name
         """
 
-        shapes = list()
-        node_dag = om.MGlobal.getSelectionListByName(self.name).getDagPath(0)
-        node_fn = om.MFnDagNode()
+        return [shape_dag.partialPathName() for shape_dag in self._get_shape_dag_paths()]
+
+    def _get_dag_path(self):
+        """
+        Returns the dag path of the control. The path is rebuilt from the control node if it is no longer valid,
+        e.g. once the control is parented below a buffer.
+
+        Returns: (MDagPath) control dag path
+        """
+
+        if not self._dag_path.isValid():
+            self._dag_path = om.MDagPath.getAPathTo(self._node.object())
+
+        return self._dag_path
+
+    def _get_shape_dag_paths(self):
+        """
+        Returns the dag paths of the non-intermediate nurbsCurves shapes parented directly below the control.
+
+        The dag paths are cached on the instance, they are walked again after set_shape_data() or add_buffer(), or if
+        one of the cached paths is no longer valid.
+
+        Returns: (list of MDagPath) curves shape dag path
+        """
+
+        if self._shape_dags is not None and all(shape_dag.isValid() for shape_dag in self._shape_dags):
+            return self._shape_dags
+
+        shape_dags = list()
+        node_dag = self._get_dag_path()
 
         for i in range(node_dag.numberOfShapesDirectlyBelow()):
-            shape_dag = node_dag.extendToShape(i)
+            # extendToShape() modifies the dag path in place, extend a copy of the control path
+            shape_dag = om.MDagPath(node_dag).extendToShape(i)
             if not shape_dag.hasFn(om.MFn.kNurbsCurve):
                 continue
-            node_fn.setObject(shape_dag)
-            if node_fn.isIntermediateObject:
+            _FN_DAG.setObject(shape_dag)
+            if _FN_DAG.isIntermediateObject:
                 continue
-            shapes.append(shape_dag.partialPathName())
+            shape_dags.append(shape_dag)
+
+        self._shape_dags = shape_dags
 
-        return shapes
+        return shape_dags
 
     def get_shape_data(self):
         """
         Gets the control nurbsCurves shapes data (points, degree, knot and periodic attributes)
         """
 
-        curve_shape = self.get_shape()
-        if not isinstance(curve_shape, collections.Iterable):
-            curve_shape = (curve_shape, )
-
         self._shape = dict()
-        for i, curve in enumerate(curve_shape):
-            self._shape['shape{0}'.format(i)] = dict(degree=1, point=None, knot=None, periodic=True)
-            curve_path = om.MGlobal.getSelectionListByName(curve).getDagPath(0)
-            curve_fn = om.MFnNurbsCurve(curve_path)
+        curve_fn = _FN_CURVE
+        for i, curve_path in enumerate(self._get_shape_dag_paths()):
+            curve_fn.setObject(curve_path)
 
-            self._shape['shape{0}'.format(i)]['degree'] = curve_fn.degree
-            self._shape['shape{0}'.format(i)]['point'] = component.get_cv_positions_from_curve(curve)
-            self._shape['shape{0}'.format(i)]['knot'] = list(curve_fn.knots())
-            self._shape['shape{0}'.format(i)]['periodic'] = True if curve_fn.form == curve_fn.kPeriodic else False
+            # Store the cv positions as a list ordered by cv index, ready to be used by set_shape_data. The positions
+            # are read from the function set already attached to the curve
+            points = [[point.x, point.y, point.z] for point in curve_fn.cvPositions(om.MSpace.kWorld)]
+
+            # Build the shape data at once rather than formatting the shape name for each of its attributes
+            self._shape['shape{0}'.format(i)] = dict(degree=curve_fn.degree,
+                                                     point=points,
+                                                     knot=list(curve_fn.knots()),
+                                                     periodic=curve_fn.form == curve_fn.kPeriodic)
 
     def set_shape_data(self):
         """
         Sets/replaces the control nurbsCurves shapes with the instance shape data (self._shape)
         """
 
-        # Delete current curve's shapes below node
-        current_shapes = self.get_shape()
-        if current_shapes:
-            cmds.delete(current_shapes)
-
-        for i, shape_name in enumerate(self._shape):
-            # Create a nurbsCurve parented under node
-            curve = cmds.createNode('nurbsCurve',
-                                    skipSelect=True,
-                                    parent=self.name,
-                                    n='{0}Shape{1}'.format(self.name, i))
-
-            # Create a temp curve with instance data
-            degree = self.shape[shape_name]['degree']
-            knot = self.shape[shape_name]['knot']
-            periodic = self.shape[shape_name]['periodic']
-            curve_points = list()
-            for key in sorted(self.shape[shape_name]['point']):
-                curve_points.append(self.shape[shape_name]['point'][key])
-
-            temp_curve = cmds.curve(degree=degree,
-                                    point=curve_points,
-                                    knot=knot,
-                                    periodic=periodic,
-                                    n='temp_transform')
-
-            # Connect temp curve local to nurbsCurve create attribute. Eval and delete temp curve
-            cmds.connectAttr('{0}.local'.format(temp_curve), '{0}.create'.format(curve))
-            cmds.dgeval('{0}.local'.format(curve))
-            cmds.delete(temp_curve)
+        # Deleting the current shapes and creating the new ones is a single undo step
+        cmds.undoInfo(openChunk=True)
+        try:
+            # Delete current curve's shapes below node
+            current_shapes = self.get_shape()
+            if current_shapes:
+                cmds.delete(current_shapes)
+            self._shape_dags = None
+
+            # Create each nurbsCurve directly below the control and set its data in a single setAttr call, rather
+            # than connecting a temp curve to a new nurbsCurve, evaluating it and deleting the temp curve
+            parent = self._get_dag_path().partialPathName()
+            # Shape data is read from the instance data directly, the shape property would query the scene shapes if
+            # the data were empty
+            for i, shape_data in enumerate(self._shape.values()):
+                degree = shape_data['degree']
+                knot = shape_data['knot']
+                periodic = shape_data['periodic']
+                curve_points = _get_ordered_points(shape_data['point'])
+
+                curve = cmds.createNode('nurbsCurve',
+                                        skipSelect=True,
+                                        parent=parent,
+                                        n='{0}Shape{1}'.format(self.name, i))
+
+                # nurbsCurve data : degree, spans, form (0 open, 2 periodic), rational, dimension, knots, knot count,
+                # cv count, cvs. Periodic curves list their overlapping cvs, spans are cvs - degree in both forms
+                cmds.setAttr('{0}.cc'.format(curve),
+                             degree,
+                             len(curve_points) - degree,
+                             2 if periodic else 0,
+                             False,
+                             3,
+                             knot,
+                             len(knot),
+                             len(curve_points),
+                             *curve_points,
+                             type='nurbsCurve')
+        finally:
+            cmds.undoInfo(closeChunk=True)
 
     def set_shape_from_library(self, value):
         """
@@ -320,25 +592,27 @@ class Control(object):
         shape_library = environment.CONTROLSHAPES_LIBRARY
         shape_file = os.path.join(shape_library, '{0}.json'.format(value))
 
-        if not os.path.isfile(shape_file):
+        try:
+            shape_data = _load_library_file(shape_file)
+        except (IOError, OSError):
             log.error('controlShape library file {0} does not exists'.format(value))
             return
 
-        with open(shape_file, 'r') as handle:
-            shape_data = json.load(handle)
         self.shape = shape_data
 
-    def store_shape_to_library(self, name):
+    def store_shape_to_library(self, name, pretty=False):
         """
         Stores the control nurbsCurves shape as a json file in the controlShape's library
+
+        :param name: (str) name of the controlShape file
+        :param pretty: (bool) indent the json file to keep it human editable, otherwise write it compact
         """
 
         shape_library = environment.CONTROLSHAPES_LIBRARY
         shape_file = os.path.join(shape_library, '{0}.json'.format(name))
 
-        data = json.dumps(self.shape, indent=2)
-        with open(shape_file, 'w+') as handle:
-            handle.write(data)
+        json_utils.dump(self.shape, shape_file, indent=pretty)
+        _LIBRARY_CACHE.pop(shape_file, None)
 
 
 # Default control shape (circle)
@@ -346,19 +620,19 @@ DEFAULT_SHAPE = {"shape0": {
     "periodic": True,
     "knot": [-2.0, -1.0, 0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
     "degree": 3,
-    "point": {
-        "0": [0.783611624891225, 4.798237340988468e-17, -0.7836116248912238],
-        "1": [-1.2643170607829326e-16, 6.785732323110913e-17, -1.108194187554388],
-        "2": [-0.7836116248912243, 4.798237340988471e-17, -0.7836116248912243],
-        "3": [-1.108194187554388, 1.966335461618786e-32, -3.21126950723723e-16],
-        "4": [-0.7836116248912245, -4.7982373409884694e-17, 0.783611624891224],
-        "5": [-3.3392053635905195e-16, -6.785732323110915e-17, 1.1081941875543881],
-        "6": [0.7836116248912238, -4.798237340988472e-17, 0.7836116248912244],
-        "7": [1.108194187554388, -3.644630067904792e-32, 5.952132599280585e-16],
-        "8": [0.783611624891225, 4.798237340988468e-17, -0.7836116248912238],
-        "9": [-1.2643170607829326e-16, 6.785732323110913e-17, -1.108194187554388],
-        "10": [-0.7836116248912243, 4.798237340988471e-17, -0.7836116248912243],
-        }
+    "point": [
+        [0.783611624891225, 4.798237340988468e-17, -0.7836116248912238],
+        [-1.2643170607829326e-16, 6.785732323110913e-17, -1.108194187554388],
+        [-0.7836116248912243, 4.798237340988471e-17, -0.7836116248912243],
+        [-1.108194187554388, 1.966335461618786e-32, -3.21126950723723e-16],
+        [-0.7836116248912245, -4.7982373409884694e-17, 0.783611624891224],
+        [-3.3392053635905195e-16, -6.785732323110915e-17, 1.1081941875543881],
+        [0.7836116248912238, -4.798237340988472e-17, 0.7836116248912244],
+        [1.108194187554388, -3.644630067904792e-32, 5.952132599280585e-16],
+        [0.783611624891225, 4.798237340988468e-17, -0.7836116248912238],
+        [-1.2643170607829326e-16, 6.785732323110913e-17, -1.108194187554388],
+        [-0.7836116248912243, 4.798237340988471e-17, -0.7836116248912243],
+        ]
     }
 }
 